@@ -1,13 +1,24 @@
+import asyncio
+import datetime
+import json
 import logging
-import toml
-import threading
-import subprocess
 import os
-import time
+import signal
 import sys
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+try:
+    import tomllib
+except ModuleNotFoundError:
+    # Python < 3.11 (the service images run 3.10)
+    import tomli as tomllib
+from collections import deque
 from pathlib import Path
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from contextlib import asynccontextmanager
 import uvicorn
 
@@ -15,144 +26,251 @@ import uvicorn
 config_path = Path("/app/config.toml")
 if not config_path.exists():
     config_path = Path(__file__).parent.parent.parent / "config.toml"
-config = toml.load(config_path)
+with open(config_path, 'rb') as config_file:
+    config = tomllib.load(config_file)
 wildwings_config = config["wildwings"]
 
-# Setup logging
+# Setup logging; the log file is written directly by the supervisor below
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(wildwings_config["logfile_path"], mode='a'),
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger("wildwings")
 
-# Global mission state with thread safety
-mission_lock = threading.Lock()
-mission_thread = None
-stop_mission_flag = threading.Event()
-current_process = None
-is_running = False
-mission_lat = None
-mission_lon = None
-
-def run_mission_background():
-    """Execute mission in background thread"""
-    global stop_mission_flag, current_process, is_running, mission_lat, mission_lon
-
-    with mission_lock:
-        if is_running:
-            logger.warning("Mission already running")
+# Log file opened once at import; appending here skips the per-record
+# formatter/handler machinery that a FileHandler would run for every line
+_log_file = open(wildwings_config["logfile_path"], 'a', encoding='utf-8')
+
+def _log_timestamp():
+    """Timestamp in the %(asctime)s shape the promtail pipeline parses"""
+    now = datetime.datetime.now()
+    return f"{now:%Y-%m-%d %H:%M:%S},{now.microsecond // 1000:03d}"
+
+def _mission_log(message, level=logging.INFO):
+    """Log a supervisor message to the console logger and the log file"""
+    logger.log(level, message)
+    _log_file.write(f"{_log_timestamp()} - wildwings - {logging.getLevelName(level)} - {message}\n")
+    _log_file.flush()
+
+# Launch script and mission directory never change at runtime; resolve and
+# prepare them once instead of repeating the syscalls on every mission start
+_LAUNCH_SCRIPT = Path("/app/launch.sh")
+_MISSION_DIR = Path("/app/mission")
+_LAUNCH_SCRIPT_READY = _LAUNCH_SCRIPT.exists()
+if _LAUNCH_SCRIPT_READY:
+    os.chmod(_LAUNCH_SCRIPT, 0o755)
+    _MISSION_DIR.mkdir(exist_ok=True)
+
+# Base subprocess environment, built once; environment changes after import
+# won't propagate, which is fine for a container-deployed service
+_MISSION_ENV = {**os.environ, 'PYTHONUNBUFFERED': '1'}
+
+@dataclass
+class MissionState:
+    """Mutable mission state, guarded by mission_lock on the event loop"""
+    task: Optional[asyncio.Task] = None
+    process: Optional[asyncio.subprocess.Process] = None
+    is_running: bool = False
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    stop_requested: asyncio.Event = field(default_factory=asyncio.Event)
+    finished: asyncio.Event = field(default_factory=asyncio.Event)
+
+# Mission state; the supervisor runs as a task on the event loop
+mission_lock = asyncio.Lock()
+mission_state = MissionState()
+
+# Ring buffer of recent mission output; maxlen keeps appends O(1) with no trimming
+logs = deque(maxlen=1000)
+
+# Cap on mission output lines logged per second; overflow is coalesced into
+# a single "lines suppressed" entry so a runaway subprocess cannot grind
+# the event loop with log work
+MAX_LOG_LINES_PER_SEC = 5000
+
+def _signal_mission(process, sig):
+    """Signal the mission's whole process group, falling back to the child alone"""
+    try:
+        os.killpg(os.getpgid(process.pid), sig)
+    except (ProcessLookupError, PermissionError):
+        try:
+            process.send_signal(sig)
+        except ProcessLookupError:
+            pass
+
+async def run_mission_background():
+    """Execute mission as a background task on the event loop"""
+    async with mission_lock:
+        if mission_state.is_running:
+            _mission_log("Mission already running", logging.WARNING)
             return
-        is_running = True
-        stop_mission_flag.clear()
+        mission_state.is_running = True
+        mission_state.stop_requested.clear()
+        mission_state.finished.clear()
 
     mission_success = False
 
     try:
-        if stop_mission_flag.is_set():
-            logger.info("Mission stopped before execution")
+        if mission_state.stop_requested.is_set():
+            _mission_log("Mission stopped before execution")
             return
 
-        logger.info("Starting WildWings mission")
-
-        # Create mission directory
-        mission_dir = Path("/app/mission")
-        mission_dir.mkdir(exist_ok=True)
-
-        # Execute launch.sh script
-        script_path = Path("/app/launch.sh")
-        if not script_path.exists():
-            raise FileNotFoundError(f"Launch script not found: {script_path}")
-
-        os.chmod(script_path, 0o755)
-
-        # Run the launch script
-        env = os.environ.copy()
-        env['PYTHONUNBUFFERED'] = '1'
-
-        # Add lat/lon to environment if provided
-        if mission_lat is not None:
-            env['MISSION_LAT'] = str(mission_lat)
-            logger.info(f"Setting MISSION_LAT={mission_lat}")
-        if mission_lon is not None:
-            env['MISSION_LON'] = str(mission_lon)
-            logger.info(f"Setting MISSION_LON={mission_lon}")
-
-        with mission_lock:
-            current_process = subprocess.Popen(
-                ["bash", str(script_path)],
-                cwd="/app",
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1,
-                env=env
-            )
-
-        logger.info("Mission subprocess started successfully")
-
-        # Stream output
-        for line in iter(current_process.stdout.readline, ''):
-            if stop_mission_flag.is_set():
-                logger.info("Stop signal received, terminating mission")
-                with mission_lock:
-                    if current_process:
-                        current_process.terminate()
+        _mission_log("Starting WildWings mission")
+
+        # Script permissions and mission directory were prepared at import
+        if not _LAUNCH_SCRIPT_READY:
+            raise FileNotFoundError(f"Launch script not found: {_LAUNCH_SCRIPT}")
+
+        # Run the launch script with the frozen base environment, copying it
+        # only when per-mission coordinates need to be added
+        env = _MISSION_ENV
+        if mission_state.lat is not None or mission_state.lon is not None:
+            env = dict(_MISSION_ENV)
+            if mission_state.lat is not None:
+                env['MISSION_LAT'] = str(mission_state.lat)
+                _mission_log(f"Setting MISSION_LAT={mission_state.lat}")
+            if mission_state.lon is not None:
+                env['MISSION_LON'] = str(mission_state.lon)
+                _mission_log(f"Setting MISSION_LON={mission_state.lon}")
+
+        # start_new_session puts the script in its own process group so stop
+        # signals reach any children it spawns, not just the bash wrapper
+        process = await asyncio.create_subprocess_exec(
+            "bash", str(_LAUNCH_SCRIPT),
+            cwd="/app",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=True,
+            env=env
+        )
+        async with mission_lock:
+            mission_state.process = process
+
+        _mission_log("Mission subprocess started successfully")
+
+        # Stream output in large chunks, amortizing the per-line Python work
+        carry = b''
+        bucket_tokens = MAX_LOG_LINES_PER_SEC
+        bucket_refill = time.monotonic()
+        suppressed = 0
+        while True:
+            if mission_state.stop_requested.is_set():
+                _mission_log("Stop signal received, terminating mission")
+                if process.returncode is None:
+                    _signal_mission(process, signal.SIGTERM)
                 mission_success = False
                 break
 
-            if line.strip():
-                logger.info(f"Mission output: {line.strip()}")
+            try:
+                chunk = await asyncio.wait_for(process.stdout.read(65536), timeout=0.1)
+            except asyncio.TimeoutError:
+                if process.returncode is not None:
+                    break
+                continue
 
-        with mission_lock:
-            if current_process:
-                current_process.wait()
-                return_code = current_process.returncode
-                logger.info(f"Mission process exited with return code: {return_code}")
+            if not chunk:
+                break
 
-                if return_code != 0:
-                    logger.error(f"Mission failed with return code: {return_code}")
-                    mission_success = False
-                else:
-                    logger.info("Mission completed successfully")
-                    mission_success = True
+            # Keep the trailing partial line for the next read
+            raw_lines = (carry + chunk).split(b'\n')
+            carry = raw_lines.pop()
+
+            # One timestamp per chunk; lines in a batch arrived within the same
+            # read. Prebuilding the full log-line prefix keeps the promtail-
+            # parseable record shape with a single concat per line below.
+            timestamp = _log_timestamp()
+            prefix = timestamp + ' - wildwings - INFO - Mission output: '
+
+            # Refill the token bucket once a second and report what was dropped
+            now = time.monotonic()
+            if now - bucket_refill >= 1.0:
+                bucket_tokens = MAX_LOG_LINES_PER_SEC
+                bucket_refill = now
+                if suppressed:
+                    entry = f"{timestamp} - wildwings - INFO - ... {suppressed} lines suppressed"
+                    logs.append(entry)
+                    _log_file.write(entry + '\n')
+                    suppressed = 0
+
+            batch = []
+            for raw_line in raw_lines:
+                stripped = raw_line.decode('utf-8', 'replace').strip()
+                if stripped:
+                    if bucket_tokens > 0:
+                        bucket_tokens -= 1
+                        batch.append(prefix + stripped)
+                    else:
+                        suppressed += 1
+            if batch:
+                logs.extend(batch)
+                # One write + flush per chunk instead of a formatter pass per line
+                _log_file.write('\n'.join(batch) + '\n')
+                _log_file.flush()
+
+        stripped = carry.decode('utf-8', 'replace').strip()
+        if stripped:
+            entry = f"{_log_timestamp()} - wildwings - INFO - Mission output: {stripped}"
+            logs.append(entry)
+            _log_file.write(entry + '\n')
+            _log_file.flush()
+
+        if suppressed:
+            entry = f"{_log_timestamp()} - wildwings - INFO - ... {suppressed} lines suppressed"
+            logs.append(entry)
+            _log_file.write(entry + '\n')
+            _log_file.flush()
+
+        return_code = await process.wait()
+        _mission_log(f"Mission process exited with return code: {return_code}")
+
+        if return_code != 0:
+            _mission_log(f"Mission failed with return code: {return_code}", logging.ERROR)
+            mission_success = False
+        else:
+            _mission_log("Mission completed successfully")
+            mission_success = True
 
     except Exception as e:
-        logger.error(f"Mission failed: {str(e)}")
+        _mission_log(f"Mission failed: {str(e)}", logging.ERROR)
         mission_success = False
     finally:
         # Cleanup process
-        with mission_lock:
-            if current_process:
-                try:
-                    if current_process.poll() is None:
-                        logger.info("Terminating process...")
-                        current_process.terminate()
-                        try:
-                            current_process.wait(timeout=5)
-                        except subprocess.TimeoutExpired:
-                            logger.warning("Process did not terminate, forcing kill...")
-                            current_process.kill()
-                            current_process.wait(timeout=2)
-                    logger.info("Process cleanup completed")
-                except Exception as cleanup_error:
-                    logger.error(f"Error during process cleanup: {cleanup_error}")
-
-            is_running = False
-            current_process = None
-            stop_mission_flag.clear()
+        async with mission_lock:
+            process = mission_state.process
+
+        if process:
+            try:
+                if process.returncode is None:
+                    _mission_log("Terminating process...")
+                    _signal_mission(process, signal.SIGTERM)
+                    try:
+                        await asyncio.wait_for(process.wait(), timeout=5)
+                    except asyncio.TimeoutError:
+                        _mission_log("Process did not terminate, forcing kill...", logging.WARNING)
+                        _signal_mission(process, signal.SIGKILL)
+                        await asyncio.wait_for(process.wait(), timeout=2)
+                _mission_log("Process cleanup completed")
+            except Exception as cleanup_error:
+                _mission_log(f"Error during process cleanup: {cleanup_error}", logging.ERROR)
+
+        async with mission_lock:
+            mission_state.is_running = False
+            mission_state.process = None
+            mission_state.stop_requested.clear()
 
         # Wait for connection cleanup
-        logger.info("Waiting for connection cleanup (5 seconds)...")
-        time.sleep(5)
+        _mission_log("Waiting for connection cleanup (5 seconds)...")
+        await asyncio.sleep(5)
 
         if mission_success:
-            logger.info("Mission thread finished")
+            _mission_log("Mission thread finished")
         else:
-            logger.error("Mission thread finished with errors")
+            _mission_log("Mission thread finished with errors", logging.ERROR)
+
+        mission_state.finished.set()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -160,46 +278,53 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("WildWings service shutting down")
 
-    global mission_thread, stop_mission_flag, current_process, is_running
-
-    with mission_lock:
-        if mission_thread and mission_thread.is_alive():
-            logger.info("Stopping running mission during shutdown")
-            stop_mission_flag.set()
-
-            if current_process:
+    async with mission_lock:
+        mission_running = mission_state.task and not mission_state.task.done()
+        process = mission_state.process
+
+    if mission_running:
+        logger.info("Stopping running mission during shutdown")
+        mission_state.stop_requested.set()
+
+        if process:
+            try:
+                _signal_mission(process, signal.SIGTERM)
+                await asyncio.wait_for(process.wait(), timeout=5)
+                logger.info("Process terminated gracefully")
+            except asyncio.TimeoutError:
+                logger.warning("Process didn't terminate gracefully, forcing kill")
+                _signal_mission(process, signal.SIGKILL)
                 try:
-                    current_process.terminate()
-                    current_process.wait(timeout=5)
-                    logger.info("Process terminated gracefully")
-                except subprocess.TimeoutExpired:
-                    logger.warning("Process didn't terminate gracefully, forcing kill")
-                    current_process.kill()
-                    try:
-                        current_process.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        logger.error("Process couldn't be killed")
-                except Exception as e:
-                    logger.error(f"Error terminating process: {e}")
+                    await asyncio.wait_for(process.wait(), timeout=2)
+                except asyncio.TimeoutError:
+                    logger.error("Process couldn't be killed")
+            except Exception as e:
+                logger.error("Error terminating process: %s", e)
 
-    if mission_thread:
-        mission_thread.join(timeout=10.0)
+    if mission_state.task and not mission_state.task.done():
+        try:
+            await asyncio.wait_for(mission_state.finished.wait(), timeout=10.0)
+        except asyncio.TimeoutError:
+            logger.warning("Mission task did not finish during shutdown")
 
-    is_running = False
+    mission_state.is_running = False
 
 app = FastAPI(
     title="WildWings Service",
     description="WildWings wildlife monitoring service",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# List only the methods/headers this API uses so the CORS middleware can
+# answer preflights from exact sets instead of wildcard reflection
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[wildwings_config["cors_origin"]],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
 )
 
 @app.get("/")
@@ -212,31 +337,27 @@ async def start_mission(
     lat: float = Query(None, description="Optional latitude coordinate"),
     lon: float = Query(None, description="Optional longitude coordinate")
 ):
-    logger.info(f"Start mission endpoint accessed with lat={lat}, lon={lon}")
-
-    global mission_thread, stop_mission_flag, is_running, mission_lat, mission_lon
+    logger.info("Start mission endpoint accessed with lat=%s, lon=%s", lat, lon)
 
-    with mission_lock:
-        if mission_thread and mission_thread.is_alive():
+    async with mission_lock:
+        if mission_state.task and not mission_state.task.done():
             logger.warning("Mission request rejected - mission already running")
             raise HTTPException(status_code=409, detail="Mission is currently running")
 
-        if is_running:
+        if mission_state.is_running:
             logger.warning("Mission request rejected - mission state indicates running")
             raise HTTPException(status_code=409, detail="Mission is currently running")
 
         # Store lat/lon for the mission
-        mission_lat = lat
-        mission_lon = lon
+        mission_state.lat = lat
+        mission_state.lon = lon
 
     try:
-        stop_mission_flag.clear()
-        mission_thread = threading.Thread(
-            target=run_mission_background,
-            name="WildWings-Mission",
-            daemon=False
+        mission_state.stop_requested.clear()
+        mission_state.task = asyncio.create_task(
+            run_mission_background(),
+            name="WildWings-Mission"
         )
-        mission_thread.start()
 
         logger.info("WildWings mission started successfully")
         response = {
@@ -250,18 +371,16 @@ async def start_mission(
         return response
 
     except Exception as e:
-        logger.error(f"Failed to start mission: {str(e)}")
+        logger.error("Failed to start mission: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to start mission: {str(e)}")
 
 @app.post("/stop_mission")
 async def stop_mission():
     logger.info("Stop mission endpoint accessed")
 
-    global mission_thread, stop_mission_flag, current_process, is_running
-
-    with mission_lock:
-        if not mission_thread or not mission_thread.is_alive():
-            if not is_running:
+    async with mission_lock:
+        if not mission_state.task or mission_state.task.done():
+            if not mission_state.is_running:
                 logger.info("No mission currently running")
                 return {
                     "status": "success",
@@ -270,34 +389,39 @@ async def stop_mission():
                 }
 
     try:
-        stop_mission_flag.set()
+        mission_state.stop_requested.set()
         logger.info("Stop mission flag set")
 
         # Terminate the process
-        with mission_lock:
-            if current_process:
-                logger.info("Terminating current process")
+        async with mission_lock:
+            process = mission_state.process
+
+        if process:
+            logger.info("Terminating current process")
+            try:
+                _signal_mission(process, signal.SIGTERM)
+                await asyncio.wait_for(process.wait(), timeout=5)
+                logger.info("Process terminated gracefully")
+            except asyncio.TimeoutError:
+                logger.warning("Process didn't terminate gracefully, forcing kill")
+                _signal_mission(process, signal.SIGKILL)
                 try:
-                    current_process.terminate()
-                    current_process.wait(timeout=5)
-                    logger.info("Process terminated gracefully")
-                except subprocess.TimeoutExpired:
-                    logger.warning("Process didn't terminate gracefully, forcing kill")
-                    current_process.kill()
-                    try:
-                        current_process.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        logger.error("Process couldn't be killed")
-                except Exception as e:
-                    logger.error(f"Error terminating process: {e}")
-
-        # Wait for mission thread
-        if mission_thread and mission_thread.is_alive():
-            logger.info("Waiting for mission thread to finish")
-            mission_thread.join(timeout=10)
-
-        with mission_lock:
-            is_running = False
+                    await asyncio.wait_for(process.wait(), timeout=2)
+                except asyncio.TimeoutError:
+                    logger.error("Process couldn't be killed")
+            except Exception as e:
+                logger.error("Error terminating process: %s", e)
+
+        # Wait for the supervisor to signal completion
+        if mission_state.task and not mission_state.task.done():
+            logger.info("Waiting for mission task to finish")
+            try:
+                await asyncio.wait_for(mission_state.finished.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                logger.warning("Mission task did not finish within timeout")
+
+        async with mission_lock:
+            mission_state.is_running = False
 
         logger.info("Mission stopped successfully")
         return {
@@ -307,64 +431,126 @@ async def stop_mission():
         }
 
     except Exception as e:
-        logger.error(f"Failed to stop mission: {str(e)}")
-        with mission_lock:
-            is_running = False
-            stop_mission_flag.set()
+        logger.error("Failed to stop mission: %s", e)
+        async with mission_lock:
+            mission_state.is_running = False
+            mission_state.stop_requested.set()
         raise HTTPException(status_code=500, detail=f"Error stopping mission: {str(e)}")
 
+# Static response skeleton for the dashboard-polled status endpoint
+_STATUS_TEMPLATE = {
+    "status": "idle",
+    "thread_alive": False,
+    "stop_requested": False,
+    "is_running": False
+}
+
 @app.get("/mission_status")
 async def mission_status():
-    global mission_thread, stop_mission_flag, is_running
-
-    with mission_lock:
-        if mission_thread and mission_thread.is_alive():
-            status = "running"
-            if stop_mission_flag.is_set():
-                status = "stopping"
-        else:
-            status = "idle"
-
-        thread_alive = mission_thread.is_alive() if mission_thread else False
-        stop_requested = stop_mission_flag.is_set()
-        running_state = is_running
-
-    return {
-        "status": status,
-        "thread_alive": thread_alive,
-        "stop_requested": stop_requested,
-        "is_running": running_state
-    }
+    # Check task liveness and the stop flag once and branch on the locals
+    async with mission_lock:
+        task_alive = bool(mission_state.task and not mission_state.task.done())
+        stop_requested = mission_state.stop_requested.is_set()
+        running_state = mission_state.is_running
+
+    if task_alive:
+        status = "stopping" if stop_requested else "running"
+    else:
+        status = "idle"
+
+    response = _STATUS_TEMPLATE.copy()
+    response["status"] = status
+    response["thread_alive"] = task_alive
+    response["stop_requested"] = stop_requested
+    response["is_running"] = running_state
+    return response
+
+def _tail(path, n, approx=256):
+    """Return the last n lines of a file by seeking near the end instead of reading it all"""
+    size = os.stat(path).st_size
+    buf = b''
+    for _ in range(4):
+        offset = max(0, size - n * approx)
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            buf = f.read()
+        if offset == 0 or buf.count(b'\n') >= n:
+            break
+        # Lines were longer than estimated - widen the window and retry
+        approx *= 2
+    return buf.decode('utf-8', 'replace').splitlines()[-n:]
+
+def _read_tail(log_file_path, lines):
+    """Read the last `lines` lines of the log file (runs in a worker thread)"""
+    path = Path(log_file_path)
+    if not path.exists():
+        return None
+    return _tail(path, lines)
+
+async def _stream_tail(log_file_path, lines):
+    """Yield the tail of the log as NDJSON chunks without building a JSON array"""
+    tail_lines = await asyncio.to_thread(_read_tail, log_file_path, lines)
+    if tail_lines is None:
+        tail_lines = list(logs)[-lines:]
+
+    chunk = []
+    chunk_size = 0
+    for line in tail_lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        chunk.append(json.dumps({"log": stripped}))
+        chunk_size += len(chunk[-1])
+        if chunk_size >= 65536:
+            yield '\n'.join(chunk) + '\n'
+            chunk = []
+            chunk_size = 0
+    if chunk:
+        yield '\n'.join(chunk) + '\n'
 
 @app.get("/logs")
-async def get_logs(lines: int = 100):
-    logger.info(f"Logs endpoint accessed - requesting {lines} lines")
+async def get_logs(lines: int = 100, format: Optional[str] = None):
+    logger.info("Logs endpoint accessed - requesting %d lines", lines)
 
     try:
         log_file_path = wildwings_config["logfile_path"]
 
-        if not Path(log_file_path).exists():
-            logger.warning(f"Log file not found at: {log_file_path}")
-            return {"logs": ["Log file not found"], "total_lines": 0}
+        # Streamed variant: starts sending before the whole tail is serialized
+        if format == "ndjson":
+            return StreamingResponse(
+                _stream_tail(log_file_path, lines),
+                media_type="application/x-ndjson"
+            )
+
+        # Offload the file read so the event loop keeps servicing other requests
+        all_lines = await asyncio.to_thread(_read_tail, log_file_path, lines)
 
-        with open(log_file_path, 'r') as f:
-            all_lines = f.readlines()
+        if all_lines is None:
+            logger.warning("Log file not found at: %s, serving in-memory buffer", log_file_path)
+            recent = list(logs)[-lines:]
+            return {"logs": recent, "total_lines": len(recent)}
 
-        recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-        file_logs = [line.strip() for line in recent_lines if line.strip()]
+        file_logs = [line.strip() for line in all_lines if line.strip()]
 
-        logger.info(f"Returning {len(file_logs)} log lines")
+        logger.info("Returning %d log lines", len(file_logs))
         return {"logs": file_logs, "total_lines": len(all_lines)}
 
     except Exception as e:
-        logger.error(f"Failed to read logs: {str(e)}")
+        logger.error("Failed to read logs: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to read logs: {str(e)}")
 
 if __name__ == "__main__":
+    debug = wildwings_config["debug"]
+    # Mission state lives in this process, so stay single-worker; uvloop and
+    # httptools (both pinned in requirements) still cut event-loop and HTTP
+    # parsing overhead per request
     uvicorn.run(
         "main:app",
         host=wildwings_config["host"],
         port=wildwings_config["port"],
-        reload=wildwings_config["debug"],
-        access_log=True
+        reload=debug,
+        workers=1,
+        loop="uvloop",
+        http="httptools",
+        access_log=debug
     )